@@ -1,50 +1,141 @@
+import atexit
+import bisect
 import json
+import mmap
+import operator
 import os
 import time
 import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from colorama import init, Fore, Back, Style
 from datetime import datetime
 
+try:
+    import orjson  # C-accelerated JSON; optional
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # streaming JSON parser; optional
+except ImportError:
+    ijson = None
+
+# Everything a corrupt or malformed library file can raise during load.
+_LOAD_ERRORS = (json.JSONDecodeError, KeyError, TypeError)
+if ijson is not None:
+    _LOAD_ERRORS += (ijson.JSONError,)
+
 # Initialize colorama for Windows support
 init(autoreset=True)
 
+# Prompts and errors reused inside input loops, formatted once at import.
+_PROMPT_YEAR = f"{Fore.CYAN}Enter the publication year: {Style.RESET_ALL}"
+_ERR_YEAR = f"{Fore.RED}Please enter a valid year (positive integer).{Style.RESET_ALL}"
+_PROMPT_READ = f"{Fore.CYAN}Have you read this book? (yes/no): {Style.RESET_ALL}"
+_ERR_YES_NO = f"{Fore.RED}Please enter 'yes' or 'no'.{Style.RESET_ALL}"
+_PROMPT_CHOICE = f"\n{Fore.CYAN}Enter your choice: {Style.RESET_ALL}"
+_PROMPT_REMOVE_NUM = f"\n{Fore.CYAN}Enter the number of the book to remove: {Style.RESET_ALL}"
+_ERR_CHOICE = f"{Fore.RED}Invalid choice. Please try again.{Style.RESET_ALL}"
+_ERR_1_OR_2 = f"{Fore.RED}Please enter 1 or 2.{Style.RESET_ALL}"
+_ERR_NUMBER = f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}"
+_PROMPT_CONTINUE = f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}"
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """Encode one log record as a newline-terminated JSON line.
+
+    Book values embedded in the record are serialized in place through
+    Book.to_dict, so callers don't pre-build throwaway dicts.
+    """
+    if orjson is not None:
+        # Passthrough so our default runs instead of orjson's own dataclass
+        # handling, which would also emit the derived cache fields.
+        return orjson.dumps(record, default=Book.to_dict,
+                            option=orjson.OPT_PASSTHROUGH_DATACLASS) + b'\n'
+    return (json.dumps(record, default=Book.to_dict) + '\n').encode('utf-8')
+
+
+def _loads(data) -> object:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
 class Book:
-    def __init__(self, title: str, author: str, year: int, genre: str, read: bool):
-        self.title = title
-        self.author = author
-        self.year = year
-        self.genre = genre
-        self.read = read
+    title: str
+    author: str
+    year: int
+    genre: str
+    read: bool
+    # Cached once so searches don't re-lower every title/author per query.
+    _title_lc: str = field(init=False, repr=False, compare=False)
+    _author_lc: str = field(init=False, repr=False, compare=False)
+
+    # Persisted fields, in serialization order; the fields beyond these are
+    # derived caches.
+    _FIELDS = ('title', 'author', 'year', 'genre', 'read')
+    _FIELD_GETTER = operator.attrgetter(*_FIELDS)
+
+    # Display pieces built once at class definition instead of per __str__ call.
+    _READ = f"{Fore.GREEN}Read"
+    _UNREAD = f"{Fore.RED}Unread"
+    _FMT = (f"{Fore.CYAN}%s{Style.RESET_ALL} by {Fore.YELLOW}%s{Style.RESET_ALL} "
+            f"({Fore.MAGENTA}%s{Style.RESET_ALL}) - {Fore.BLUE}%s{Style.RESET_ALL} - %s{Style.RESET_ALL}")
+
+    def __post_init__(self):
+        self._title_lc = self.title.lower()
+        self._author_lc = self.author.lower()
 
     def to_dict(self) -> Dict:
-        return {
-            'title': self.title,
-            'author': self.author,
-            'year': self.year,
-            'genre': self.genre,
-            'read': self.read
-        }
+        return dict(zip(Book._FIELDS, Book._FIELD_GETTER(self)))
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Book':
-        return cls(
-            title=data['title'],
-            author=data['author'],
-            year=data['year'],
-            genre=data['genre'],
-            read=data['read']
-        )
+        return cls(**data)
 
     def __str__(self) -> str:
-        read_status = f"{Fore.GREEN}Read" if self.read else f"{Fore.RED}Unread"
-        return f"{Fore.CYAN}{self.title}{Style.RESET_ALL} by {Fore.YELLOW}{self.author}{Style.RESET_ALL} ({Fore.MAGENTA}{self.year}{Style.RESET_ALL}) - {Fore.BLUE}{self.genre}{Style.RESET_ALL} - {read_status}{Style.RESET_ALL}"
+        return Book._FMT % (self.title, self.author, self.year, self.genre,
+                            Book._READ if self.read else Book._UNREAD)
 
 class LibraryManager:
-    def __init__(self, filename: str = "library.json"):
+    # How many queued mutations to coalesce into one log append.
+    FLUSH_EVERY = 16
+    # Logs above this size are mmapped on load; below it, mmap setup
+    # costs more than the copy it saves.
+    MMAP_THRESHOLD = 1 << 20
+
+    def __init__(self, filename: str = "library.jsonl"):
         self.filename = filename
+        self.legacy_filename = os.path.splitext(filename)[0] + ".json"
         self.books: List[Book] = []
+        self._by_title: Dict[str, List[Book]] = defaultdict(list)
+        self._genre_counts: Counter = Counter()
+        self._read_count = 0
+        # Lazily built (haystack, starts) pair for substring title search;
+        # None means stale and rebuilt on next search.
+        self._title_search: Optional[tuple] = None
+        self._log_lines = 0
+        self._dirty = False
+        self._pending: List[Dict] = []
+        # True while the on-disk log is missing a full snapshot it needs
+        # (failed migration or torn-tail rewrite); appends wait until then.
+        self._need_snapshot = False
+        # The menu never changes; build it once instead of per loop iteration.
+        self._menu_header = (f"\n{Fore.CYAN}{'=' * 50}\n"
+                             f"{'Personal Library Manager'.center(50)}\n"
+                             f"{'=' * 50}{Style.RESET_ALL}\n")
+        self._menu = (f"\n{Fore.CYAN}Menu:{Style.RESET_ALL}\n"
+                      f"{Fore.YELLOW}1.{Style.RESET_ALL} Add a book\n"
+                      f"{Fore.YELLOW}2.{Style.RESET_ALL} Remove a book\n"
+                      f"{Fore.YELLOW}3.{Style.RESET_ALL} Search for a book\n"
+                      f"{Fore.YELLOW}4.{Style.RESET_ALL} Display all books\n"
+                      f"{Fore.YELLOW}5.{Style.RESET_ALL} Display statistics\n"
+                      f"{Fore.YELLOW}6.{Style.RESET_ALL} Exit\n")
         self.load_library()
+        atexit.register(self.flush)
 
     def print_header(self, text: str) -> None:
         """Print a formatted header."""
@@ -53,35 +144,176 @@ class LibraryManager:
         print(f"{'=' * 50}{Style.RESET_ALL}\n")
 
     def loading_animation(self, text: str, duration: float = 1.0) -> None:
-        """Display a loading animation."""
+        """Display a loading animation (opt-in via LIBMGR_ANIMATE)."""
+        if not os.environ.get('LIBMGR_ANIMATE'):
+            return
         print(f"\n{Fore.YELLOW}{text}", end="", flush=True)
         for _ in range(3):
             time.sleep(duration/3)
             print(".", end="", flush=True)
         print(f"{Style.RESET_ALL}\n")
 
+    def _index_book(self, book: Book) -> None:
+        """Register a book in the lookup index and running statistics."""
+        self._by_title[book._title_lc].append(book)
+        self._genre_counts[book.genre] += 1
+        self._read_count += book.read
+        self._title_search = None
+
+    def _unindex_book(self, book: Book) -> None:
+        """Drop a book from the lookup index and running statistics."""
+        self._by_title[book._title_lc].remove(book)
+        self._genre_counts[book.genre] -= 1
+        if not self._genre_counts[book.genre]:
+            del self._genre_counts[book.genre]
+        self._read_count -= book.read
+        self._title_search = None
+
+    def _replay(self, lines) -> bool:
+        """Apply logged mutation records, in order, to the in-memory library.
+
+        Returns True if a torn trailing record was skipped — the expected
+        crash artifact of an append-only log. Corruption anywhere else still
+        propagates to the caller's load-error fallback.
+        """
+        for line in lines:
+            complete = line.endswith(b'\n')
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                if not complete:
+                    # Interrupted append; keep everything replayed so far.
+                    return True
+                raise
+            self._log_lines += 1
+            if record['op'] == 'add':
+                book = Book.from_dict(record['book'])
+                self.books.append(book)
+                self._index_book(book)
+            elif record['op'] == 'remove':
+                key = record['key']
+                # Resolve through the title index so replay doesn't rebuild a
+                # dict per book across the whole list for every remove record.
+                for book in self._by_title.get(key['title'].lower(), ()):
+                    if book.to_dict() == key:
+                        self.books.remove(book)
+                        self._unindex_book(book)
+                        break
+        return False
+
     def load_library(self) -> None:
-        """Load the library from a JSON file if it exists."""
+        """Load the library by replaying the JSON-lines log if it exists."""
+        self.books = []
+        self._by_title.clear()
+        self._genre_counts.clear()
+        self._read_count = 0
+        self._log_lines = 0
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r') as file:
-                    data = json.load(file)
-                    self.books = [Book.from_dict(book_data) for book_data in data]
+                with open(self.filename, 'rb') as file:
+                    if os.path.getsize(self.filename) > self.MMAP_THRESHOLD:
+                        # Zero-copy read path: the kernel pages in only what
+                        # the replay actually touches.
+                        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            torn = self._replay(iter(mm.readline, b''))
+                    else:
+                        torn = self._replay(file)
+                if torn:
+                    # Rewrite a clean snapshot so later appends don't land on
+                    # the same line as the partial record.
+                    print(f"{Fore.YELLOW}Discarded an incomplete record at the end of the library file.{Style.RESET_ALL}")
+                    self._need_snapshot = not self.save_library()
                 self.loading_animation("Loading your library")
-            except (json.JSONDecodeError, KeyError):
+            except _LOAD_ERRORS:
+                print(f"{Fore.RED}Error loading library file. Starting with empty library.{Style.RESET_ALL}")
+                self.books = []
+                self._by_title.clear()
+                self._genre_counts.clear()
+                self._read_count = 0
+                self._log_lines = 0
+        elif os.path.exists(self.legacy_filename):
+            # Migrate a library saved by older versions as a single JSON array.
+            try:
+                if ijson is not None and os.path.getsize(self.legacy_filename) > self.MMAP_THRESHOLD:
+                    # Stream the array so peak memory is one record at a time
+                    # instead of the whole document plus its parsed list.
+                    with open(self.legacy_filename, 'rb') as file:
+                        self.books = [Book.from_dict(book_data)
+                                      for book_data in ijson.items(file, 'item')]
+                else:
+                    with open(self.legacy_filename, 'rb') as file:
+                        data = _loads(file.read())
+                    # The array length is known, so fill a pre-sized list
+                    # rather than growing one through ~log2(N) reallocations.
+                    self.books = [None] * len(data)
+                    for i, book_data in enumerate(data):
+                        self.books[i] = Book.from_dict(book_data)
+                for book in self.books:
+                    self._index_book(book)
+                self._need_snapshot = not self.save_library()
+                self.loading_animation("Loading your library")
+            except _LOAD_ERRORS:
                 print(f"{Fore.RED}Error loading library file. Starting with empty library.{Style.RESET_ALL}")
                 self.books = []
-        else:
-            self.books = []
 
-    def save_library(self) -> None:
-        """Save the library to a JSON file."""
+    def save_library(self) -> bool:
+        """Rewrite the log as a compact snapshot of the current library.
+
+        Returns True once the snapshot has landed on disk.
+        """
         try:
-            with open(self.filename, 'w') as file:
-                json.dump([book.to_dict() for book in self.books], file, indent=4)
+            tmp = self.filename + '.tmp'
+            with open(tmp, 'wb') as file:
+                for book in self.books:
+                    file.write(_dumps_line({'op': 'add', 'book': book}))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp, self.filename)
+            self._log_lines = len(self.books)
+            self._pending = []
+            self._dirty = False
+            self._need_snapshot = False
             self.loading_animation("Saving your library")
+            return True
+        except IOError:
+            print(f"{Fore.RED}Error saving library to file.{Style.RESET_ALL}")
+            return False
+
+    def compact(self) -> None:
+        """Rewrite the full snapshot, discarding superseded log entries."""
+        self.save_library()
+
+    def _append_op(self, record: Dict) -> None:
+        """Queue a mutation record, flushing to the log every few mutations."""
+        self._pending.append(record)
+        self._dirty = True
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all queued mutation records to the log in one append."""
+        if self._need_snapshot:
+            # A delta-only log would shadow the data the missing snapshot
+            # was meant to carry; retry the full rewrite until one lands.
+            self.save_library()
+            return
+        if not self._dirty:
+            return
+        try:
+            with open(self.filename, 'ab') as file:
+                file.writelines(_dumps_line(record) for record in self._pending)
+            self._log_lines += len(self._pending)
+            self._pending = []
+            self._dirty = False
         except IOError:
+            # Keep the queue intact so a later flush retries the whole batch.
             print(f"{Fore.RED}Error saving library to file.{Style.RESET_ALL}")
+            return
+        if self._log_lines > 2 * max(len(self.books), 1):
+            self.compact()
 
     def add_book(self) -> None:
         """Add a new book to the library."""
@@ -91,25 +323,26 @@ class LibraryManager:
         
         while True:
             try:
-                year = int(input(f"{Fore.CYAN}Enter the publication year: {Style.RESET_ALL}"))
+                year = int(input(_PROMPT_YEAR))
                 if year < 0:
                     raise ValueError
                 break
             except ValueError:
-                print(f"{Fore.RED}Please enter a valid year (positive integer).{Style.RESET_ALL}")
-        
+                print(_ERR_YEAR)
+
         genre = input(f"{Fore.CYAN}Enter the genre: {Style.RESET_ALL}").strip()
-        
+
         while True:
-            read_input = input(f"{Fore.CYAN}Have you read this book? (yes/no): {Style.RESET_ALL}").lower().strip()
+            read_input = input(_PROMPT_READ).lower().strip()
             if read_input in ['yes', 'no']:
                 read = read_input == 'yes'
                 break
-            print(f"{Fore.RED}Please enter 'yes' or 'no'.{Style.RESET_ALL}")
+            print(_ERR_YES_NO)
         
         new_book = Book(title, author, year, genre, read)
         self.books.append(new_book)
-        self.save_library()
+        self._index_book(new_book)
+        self._append_op({'op': 'add', 'book': new_book})
         print(f"\n{Fore.GREEN}Book added successfully!{Style.RESET_ALL}")
 
     def remove_book(self) -> None:
@@ -117,7 +350,7 @@ class LibraryManager:
         self.print_header("Remove a Book")
         title = input(f"{Fore.CYAN}Enter the title of the book to remove: {Style.RESET_ALL}").strip()
         
-        found_books = [book for book in self.books if book.title.lower() == title.lower()]
+        found_books = self._by_title.get(title.lower(), [])[:]
         
         if not found_books:
             print(f"{Fore.RED}No book found with that title.{Style.RESET_ALL}")
@@ -125,26 +358,57 @@ class LibraryManager:
         
         if len(found_books) > 1:
             print(f"\n{Fore.YELLOW}Multiple books found with that title:{Style.RESET_ALL}")
-            for i, book in enumerate(found_books, 1):
-                print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}")
+            sys.stdout.write('\n'.join(
+                f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}"
+                for i, book in enumerate(found_books, 1)) + '\n')
             
             while True:
                 try:
-                    choice = int(input(f"\n{Fore.CYAN}Enter the number of the book to remove: {Style.RESET_ALL}"))
+                    choice = int(input(_PROMPT_REMOVE_NUM))
                     if 1 <= choice <= len(found_books):
                         book_to_remove = found_books[choice - 1]
                         self.books.remove(book_to_remove)
-                        self.save_library()
+                        self._unindex_book(book_to_remove)
+                        self._append_op({'op': 'remove', 'key': book_to_remove})
                         print(f"\n{Fore.GREEN}Book removed successfully!{Style.RESET_ALL}")
                         return
-                    print(f"{Fore.RED}Invalid choice. Please try again.{Style.RESET_ALL}")
+                    print(_ERR_CHOICE)
                 except ValueError:
-                    print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
+                    print(_ERR_NUMBER)
         else:
             self.books.remove(found_books[0])
-            self.save_library()
+            self._unindex_book(found_books[0])
+            self._append_op({'op': 'remove', 'key': found_books[0]})
             print(f"\n{Fore.GREEN}Book removed successfully!{Style.RESET_ALL}")
 
+    def _search_titles(self, term: str) -> List[Book]:
+        """Find books whose lowercase title contains term.
+
+        Searches one NUL-joined concatenation of all titles with str.find
+        instead of scanning book by book; an offset table maps each hit back
+        to its book. The index is rebuilt lazily after any add or remove.
+        """
+        if not self.books:
+            return []
+        if self._title_search is None:
+            starts = [0] * len(self.books)
+            pos = 0
+            for i, book in enumerate(self.books):
+                starts[i] = pos
+                pos += len(book._title_lc) + 1
+            self._title_search = ('\x00'.join(book._title_lc for book in self.books), starts)
+        haystack, starts = self._title_search
+        results = []
+        pos = haystack.find(term)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            results.append(self.books[i])
+            # Resume at the next title so each book is reported once.
+            if i + 1 == len(starts):
+                break
+            pos = haystack.find(term, starts[i + 1])
+        return results
+
     def search_books(self) -> None:
         """Search for books by title or author."""
         self.print_header("Search for a Book")
@@ -154,26 +418,27 @@ class LibraryManager:
         
         while True:
             try:
-                choice = int(input(f"\n{Fore.CYAN}Enter your choice: {Style.RESET_ALL}"))
+                choice = int(input(_PROMPT_CHOICE))
                 if choice in [1, 2]:
                     break
-                print(f"{Fore.RED}Please enter 1 or 2.{Style.RESET_ALL}")
+                print(_ERR_1_OR_2)
             except ValueError:
-                print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
+                print(_ERR_NUMBER)
         
         search_term = input(f"{Fore.CYAN}Enter the {'title' if choice == 1 else 'author'}: {Style.RESET_ALL}").strip().lower()
         
         if choice == 1:
-            results = [book for book in self.books if search_term in book.title.lower()]
+            results = self._search_titles(search_term)
         else:
-            results = [book for book in self.books if search_term in book.author.lower()]
+            results = [book for book in self.books if search_term in book._author_lc]
         
         if not results:
             print(f"\n{Fore.RED}No matching books found.{Style.RESET_ALL}")
         else:
             print(f"\n{Fore.GREEN}Matching Books:{Style.RESET_ALL}")
-            for i, book in enumerate(results, 1):
-                print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}")
+            sys.stdout.write('\n'.join(
+                f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}"
+                for i, book in enumerate(results, 1)) + '\n')
 
     def display_all_books(self) -> None:
         """Display all books in the library."""
@@ -182,8 +447,9 @@ class LibraryManager:
             print(f"{Fore.YELLOW}Your library is empty.{Style.RESET_ALL}")
             return
         
-        for i, book in enumerate(self.books, 1):
-            print(f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}")
+        sys.stdout.write('\n'.join(
+            f"{Fore.CYAN}{i}.{Style.RESET_ALL} {book}"
+            for i, book in enumerate(self.books, 1)) + '\n')
 
     def display_statistics(self) -> None:
         """Display library statistics."""
@@ -193,44 +459,34 @@ class LibraryManager:
             print(f"{Fore.YELLOW}No books in the library.{Style.RESET_ALL}")
             return
         
-        read_books = sum(1 for book in self.books if book.read)
-        percentage_read = (read_books / total_books) * 100
-        
+        percentage_read = (self._read_count / total_books) * 100
+
         print(f"{Fore.CYAN}Total books:{Style.RESET_ALL} {Fore.YELLOW}{total_books}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Percentage read:{Style.RESET_ALL} {Fore.YELLOW}{percentage_read:.1f}%{Style.RESET_ALL}")
-        
+
         # Additional statistics
-        genres = {}
-        for book in self.books:
-            genres[book.genre] = genres.get(book.genre, 0) + 1
-        
         print(f"\n{Fore.CYAN}Books by genre:{Style.RESET_ALL}")
-        for genre, count in sorted(genres.items(), key=lambda x: x[1], reverse=True):
+        for genre, count in self._genre_counts.most_common():
             print(f"{Fore.YELLOW}{genre}:{Style.RESET_ALL} {count}")
 
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # ANSI clear + home; colorama translates this on legacy Windows
+        # consoles, avoiding a fork/exec of cls/clear per menu iteration.
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
     def run(self) -> None:
         """Run the library manager program."""
         while True:
             self.clear_screen()
-            print(f"\n{Fore.CYAN}{'=' * 50}")
-            print(f"{'Personal Library Manager'.center(50)}")
-            print(f"{'=' * 50}{Style.RESET_ALL}")
+            sys.stdout.write(self._menu_header)
             print(f"\n{Fore.YELLOW}Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Style.RESET_ALL}")
-            print(f"\n{Fore.CYAN}Menu:{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}1.{Style.RESET_ALL} Add a book")
-            print(f"{Fore.YELLOW}2.{Style.RESET_ALL} Remove a book")
-            print(f"{Fore.YELLOW}3.{Style.RESET_ALL} Search for a book")
-            print(f"{Fore.YELLOW}4.{Style.RESET_ALL} Display all books")
-            print(f"{Fore.YELLOW}5.{Style.RESET_ALL} Display statistics")
-            print(f"{Fore.YELLOW}6.{Style.RESET_ALL} Exit")
-            
+            sys.stdout.write(self._menu)
+
             try:
-                choice = int(input(f"\n{Fore.CYAN}Enter your choice: {Style.RESET_ALL}"))
-                
+                choice = int(input(_PROMPT_CHOICE))
+
                 if choice == 1:
                     self.add_book()
                 elif choice == 2:
@@ -242,18 +498,23 @@ class LibraryManager:
                 elif choice == 5:
                     self.display_statistics()
                 elif choice == 6:
+                    self.flush()
                     self.loading_animation("Saving and exiting")
                     print(f"\n{Fore.GREEN}Library saved to file. Goodbye!{Style.RESET_ALL}")
                     break
                 else:
                     print(f"{Fore.RED}Invalid choice. Please enter a number between 1 and 6.{Style.RESET_ALL}")
                 
-                input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+                input(_PROMPT_CONTINUE)
             
             except ValueError:
-                print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
-                input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+                print(_ERR_NUMBER)
+                input(_PROMPT_CONTINUE)
 
 if __name__ == "__main__":
     library = LibraryManager()
-    library.run()
+    try:
+        library.run()
+    except KeyboardInterrupt:
+        library.flush()
+        print(f"\n{Fore.GREEN}Library saved to file. Goodbye!{Style.RESET_ALL}")